@@ -10,34 +10,278 @@ Documentation:
 - https://api.builtwith.com/keywords-api
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import requests
-from typing import Optional, Dict, List, Union, Literal
-from datetime import datetime
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Iterable, List, Tuple, Union, Literal
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
 import os
+import time
+from urllib.parse import urlencode
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 load_dotenv()
 builtWithAPIKey = os.getenv("BUILTWITH_API_KEY", None)
 
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# (readable name, API key, kind) for Lists API result fields, in output order.
+# kind is 'list' for fields defaulting to [], 'epoch' for Unix timestamps.
+_FIELD_MAP = (
+    ('domain', 'D', None),
+    ('locations_on_site', 'LOS', 'list'),
+    ('first_detected', 'FD', 'epoch'),
+    ('last_detected', 'LD', 'epoch'),
+    ('monthly_spend_usd', 'S', None),
+    ('unique_products', 'SKU', None),
+    ('estimated_revenue', 'R', None),
+    ('social_followers', 'F', None),
+    ('employee_count', 'E', None),
+    ('page_rank', 'A', None),
+    ('tranco_rank', 'Q', None),
+    ('majestic_rank', 'M', None),
+    ('umbrella_rank', 'U', None),
+)
+_EPOCH_FIELDS = tuple(key for key, _, kind in _FIELD_MAP if kind == 'epoch')
+
+
+def _loads(data: bytes):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    Decoding the raw bytes skips the charset detection that
+    response.text/response.json() run over the whole body.
+    """
+    return _json.loads(data)
+
+
+def _has_charset(response) -> bool:
+    """Whether the response's Content-Type declares a charset."""
+    return "charset=" in response.headers.get("Content-Type", "").lower()
+
+
+def _conditional_cache_key(format: str, raw: bool, params: Dict[str, str]) -> str:
+    """Canonical key for a request, independent of parameter order."""
+    return f"{format}:{raw}?{urlencode(sorted(params.items()))}"
+
+
+def _conditional_headers(response) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a response's validators."""
+    headers = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        headers["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
 class BuiltWithAPIError(Exception):
     """Base exception for BuiltWith API errors"""
     pass
 
 
+def _is_cacheable(response: requests.Response) -> bool:
+    """Keep API error payloads out of the response cache."""
+    return b'"Errors"' not in response.content
+
+
+class _RetryPolicy:
+    """
+    Retry policy for the httpx transports, for 429 and 5xx GET responses.
+    
+    Mirrors the urllib3 Retry policy mounted on requests sessions: exponential
+    backoff between attempts, honoring the server's Retry-After header.
+    """
+    
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+    BACKOFF_MAX = 120
+    
+    def __init__(self, transport, total: int = 5, backoff_factor: float = 1.0):
+        self._transport = transport
+        self.total = total
+        self.backoff_factor = backoff_factor
+    
+    def _should_retry(self, request: httpx.Request, response: httpx.Response, attempt: int) -> bool:
+        """Whether the response should be retried after the given attempt."""
+        return (
+            request.method == "GET"
+            and response.status_code in self.RETRY_STATUSES
+            and attempt < self.total
+        )
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before the next attempt."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            if retry_after.isdigit():
+                return float(retry_after)
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+        return min(self.backoff_factor * (2 ** attempt), self.BACKOFF_MAX)
+
+
+class _RetryTransport(_RetryPolicy, httpx.BaseTransport):
+    """httpx transport that retries rate-limited (429) and 5xx GET responses."""
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._transport.handle_request(request)
+            if not self._should_retry(request, response, attempt):
+                return response
+            response.close()
+            time.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+    
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncRetryTransport(_RetryPolicy, httpx.AsyncBaseTransport):
+    """Async httpx transport that retries rate-limited (429) and 5xx GET responses."""
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if not self._should_retry(request, response, attempt):
+                return response
+            await response.aclose()
+            await asyncio.sleep(self._retry_delay(response, attempt))
+            attempt += 1
+    
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _create_session(
+    cache: bool = False,
+    cache_ttl: int = 86400,
+    use_httpx: bool = False
+) -> Union[requests.Session, httpx.Client]:
+    """
+    Create an HTTP session with a connection pool sized for concurrent use.
+    
+    Args:
+        cache: Cache successful responses in a SQLite database in the user cache directory (requires requests-cache)
+        cache_ttl: Seconds before a cached response expires
+        use_httpx: Use an HTTP/2 httpx Client instead of a requests Session (with
+            the same 429/5xx retry policy and redirect following)
+    
+    Returns:
+        Configured requests Session, or httpx Client if use_httpx is set
+        
+    Raises:
+        ValueError: If both cache and use_httpx are enabled
+        ImportError: If cache is enabled but requests-cache is not installed
+    """
+    if use_httpx:
+        if cache:
+            raise ValueError("Response caching is not supported with 'use_httpx=True'")
+        # HTTP/2 multiplexes concurrent requests over a single connection
+        return httpx.Client(
+            transport=_RetryTransport(
+                httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=32),
+                    retries=3
+                )
+            ),
+            follow_redirects=True,
+            timeout=30
+        )
+    
+    if cache:
+        try:
+            from requests_cache import CachedSession
+        except ImportError:
+            raise ImportError("Response caching requires requests-cache: pip install requests-cache")
+        # Stored in the user cache directory; the API key is redacted from
+        # cached requests and left out of the cache key
+        session = CachedSession(
+            "builtwith",
+            backend="sqlite",
+            use_cache_dir=True,
+            ignored_parameters=["KEY"],
+            expire_after=cache_ttl,
+            allowable_codes=(200,),
+            cache_control=True,
+            filter_fn=_is_cacheable
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        # Transient failures (rate limits, 5xx) are retried in place, honoring
+        # Retry-After, so long paginated crawls don't have to restart
+        max_retries=Retry(
+            total=5,
+            connect=3,
+            read=3,
+            status=5,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(["GET"])
+        )
+    )
+    session.mount("https://", adapter)
+    return session
+
+
 class BuiltWithListsClient:
     """Client for interacting with the BuiltWith Lists API to get websites using a specific technology"""
     
     BASE_URL = "https://api.builtwith.com/lists12/api"
     
-    def __init__(self, api_key: str = builtWithAPIKey):
+    def __init__(
+        self,
+        api_key: str = builtWithAPIKey,
+        cache: bool = False,
+        cache_ttl: int = 86400,
+        use_httpx: bool = False,
+        conditional_requests: bool = False
+    ):
         """
         Initialize the BuiltWith API client.
         
         Args:
             api_key: Your BuiltWith API key
+            cache: Cache successful responses on disk so repeated queries don't spend API credits
+            cache_ttl: Seconds before a cached response expires (default 1 day)
+            use_httpx: Send requests through an HTTP/2 httpx Client instead of requests
+            conditional_requests: Remember ETag/Last-Modified of responses in memory and
+                revalidate repeat requests, reusing the stored body on 304 Not Modified
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.cache = cache
+        self.use_httpx = use_httpx
+        self.session = _create_session(cache=cache, cache_ttl=cache_ttl, use_httpx=use_httpx)
+        self._conditional_cache: Optional[Dict[str, Tuple[Dict[str, str], Union[str, bytes]]]] = (
+            {} if conditional_requests else None
+        )
+        self._urls = {fmt: f"{self.BASE_URL}.{fmt}" for fmt in ("json", "xml", "txt", "csv", "tsv")}
         if self.api_key is None:
             raise ValueError("BUILTWITH_API_KEY is not set")
     
@@ -50,18 +294,117 @@ class BuiltWithListsClient:
             
         Returns:
             Full API endpoint URL
+            
+        Raises:
+            ValueError: If the format is not supported
         """
-        return f"{self.BASE_URL}.{format}"
+        try:
+            return self._urls[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format {format!r}, expected one of: {', '.join(self._urls)}") from None
     
     def _make_request(
         self,
         params: Dict[str, Union[str, bool]],
+        format: str = "json",
+        raw: bool = False
+    ) -> Union[Dict, str, bytes]:
+        """
+        Make a request to the BuiltWith API.
+        
+        Args:
+            params: Query parameters for the API request
+            format: Response format (json, xml, txt, csv, tsv)
+            raw: Return the undecoded body bytes for non-json formats
+            
+        Returns:
+            Parsed JSON dict for json format, raw text (or bytes if raw) for other formats
+            
+        Raises:
+            BuiltWithAPIError: If the API returns an error or request fails
+        """
+        url = self._build_url(format)
+        headers = dict(_JSON_HEADERS) if format == "json" else {}
+        
+        # Revalidate a previously seen response instead of downloading it again
+        cache_key = None
+        cached = None
+        if self._conditional_cache is not None:
+            cache_key = _conditional_cache_key(format, raw, params)
+            cached = self._conditional_cache.get(cache_key)
+            if cached is not None:
+                headers.update(cached[0])
+        
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
+            if cached is not None and response.status_code == 304:
+                # JSON is stored as body bytes so each hit returns a fresh object
+                return _loads(cached[1]) if format == "json" else cached[1]
+            response.raise_for_status()
+            
+            if format == "json":
+                result = _loads(response.content)
+                if isinstance(result, dict) and 'Errors' in result:
+                    raise BuiltWithAPIError(f"API Error: {result['Errors']}")
+            elif raw:
+                result = response.content
+            else:
+                result = response.text
+                
+        except (requests.exceptions.RequestException, httpx.HTTPError) as e:
+            raise BuiltWithAPIError(f"Request failed: {str(e)}")
+        except ValueError as e:
+            raise BuiltWithAPIError(f"Invalid JSON response: {str(e)}")
+        
+        if cache_key is not None:
+            validators = _conditional_headers(response)
+            if validators:
+                body = response.content if format == "json" else result
+                self._conditional_cache[cache_key] = (validators, body)
+        
+        return result
+    
+    @staticmethod
+    def _async_client(max_connections: int = 50) -> httpx.AsyncClient:
+        """
+        Create an HTTP/2 async client for a single async call.
+        
+        A new client is created per call so its connection pool is bound to
+        the event loop that is running it. It uses the same 429/5xx retry
+        policy as the sync transports.
+        
+        Args:
+            max_connections: Maximum number of concurrent connections
+            
+        Returns:
+            httpx AsyncClient, to be used as an async context manager
+        """
+        return httpx.AsyncClient(
+            transport=_AsyncRetryTransport(
+                httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=min(20, max_connections),
+                        max_connections=max_connections
+                    ),
+                    retries=3
+                )
+            ),
+            follow_redirects=True,
+            timeout=30
+        )
+    
+    async def _amake_request(
+        self,
+        client: httpx.AsyncClient,
+        params: Dict[str, Union[str, bool]],
         format: str = "json"
     ) -> Union[Dict, str]:
         """
-        Make a request to the BuiltWith API.
+        Make an asynchronous request to the BuiltWith API.
         
         Args:
+            client: Async client to send the request with
             params: Query parameters for the API request
             format: Response format (json, xml, txt, csv, tsv)
             
@@ -74,47 +417,55 @@ class BuiltWithListsClient:
         url = self._build_url(format)
         
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            headers = _JSON_HEADERS if format == "json" else None
+            response = await client.get(url, params=params, headers=headers)
             response.raise_for_status()
             
             if format == "json":
-                data = response.json()
+                data = _loads(response.content)
                 if isinstance(data, dict) and 'Errors' in data:
                     raise BuiltWithAPIError(f"API Error: {data['Errors']}")
                 return data
             return response.text
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise BuiltWithAPIError(f"Request failed: {str(e)}")
+        except ValueError as e:
+            raise BuiltWithAPIError(f"Invalid JSON response: {str(e)}")
     
-    def get_tech_list(
+    @staticmethod
+    def _validate_tech_args(since: Optional[str], include_all: bool) -> None:
+        """
+        Check that the Lists API query arguments can be combined.
+        
+        Raises:
+            ValueError: If both 'since' and 'include_all' are specified
+        """
+        if since and include_all:
+            raise ValueError("Cannot use 'since' parameter with 'include_all=True'")
+    
+    def _build_tech_params(
         self,
         technology: str,
         include_meta: bool = False,
-        country: Optional[Union[str, List[str]]] = None,
+        country: Optional[Union[str, Iterable[str]]] = None,
         offset: Optional[str] = None,
         since: Optional[str] = None,
-        include_all: bool = False,
-        format: Literal["json", "xml", "txt", "csv", "tsv"] = "json"
-    ) -> Union[Dict, str]:
+        include_all: bool = False
+    ) -> Dict[str, str]:
         """
-        Get websites using a specific technology.
+        Build the query parameters for a Lists API request.
         
         Args:
-            technology: Technology name (e.g., "Shopify", "Magento")
-            include_meta: Include company metadata (name, emails, phones, social)
-            country: ISO 3166-1 alpha-2 code(s) (e.g., "US" or ["US", "CA"])
+            technology: Technology name
+            include_meta: Include company metadata
+            country: ISO 3166-1 alpha-2 code(s)
             offset: Pagination token from NextOffset field
-            since: Date filter (e.g., "2024-01-01" or "30 Days Ago")
+            since: Date filter
             include_all: Include sites that stopped using the technology
-            format: Response format (json, xml, txt, csv, tsv)
             
         Returns:
-            Dict with 'NextOffset' and 'Results' keys for json format, raw text for other formats
-            
-        Raises:
-            ValueError: If both 'since' and 'include_all' are specified
-            BuiltWithAPIError: If the API request fails
+            Dict of query parameters
         """
         params = {
             "KEY": self.api_key,
@@ -124,30 +475,249 @@ class BuiltWithListsClient:
         if include_meta:
             params["META"] = "yes"
         
-        if country:
-            if isinstance(country, list):
-                params["COUNTRY"] = ",".join(country)
-            else:
+        if country is not None:
+            country = country if isinstance(country, str) else ",".join(country)
+            if country:
                 params["COUNTRY"] = country
         
         if offset:
             params["OFFSET"] = offset
         
         if since:
-            if include_all:
-                raise ValueError("Cannot use 'since' parameter with 'include_all=True'")
             params["SINCE"] = since
         
         if include_all:
             params["ALL"] = "yes"
         
-        return self._make_request(params, format)
+        return params
+    
+    def _iter_results(self, params: Dict[str, str]):
+        """
+        Stream the results of a single json page one site at a time.
+        
+        When ijson is installed, the response body is parsed incrementally and
+        the full page is never materialized. Otherwise the page is fetched and
+        decoded in one piece. The same buffered path is used when responses are
+        cached, because the cache needs the whole body. It is also used with
+        conditional requests, which store the decoded page, and with httpx,
+        which has no raw stream for ijson to read.
+        
+        Args:
+            params: Query parameters for the API request
+            
+        Yields:
+            Dict: Each site result of the page
+            
+        Returns:
+            The page's NextOffset token (as the generator's return value)
+            
+        Raises:
+            BuiltWithAPIError: If the API returns an error or request fails
+        """
+        if ijson is None or self.cache or self._conditional_cache is not None or self.use_httpx:
+            page = self._make_request(params, "json")
+            yield from page.get('Results', [])
+            return page.get('NextOffset')
+        
+        url = self._build_url("json")
+        next_offset = None
+        has_errors = False
+        errors = None
+        builder = None
+        builder_prefix = None
+        
+        try:
+            with self.session.get(
+                url, params=params, headers=_JSON_HEADERS, stream=True, timeout=30
+            ) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == builder_prefix and event in ('end_map', 'end_array'):
+                            if builder_prefix == 'Errors':
+                                errors = builder.value
+                            else:
+                                yield builder.value
+                            builder = None
+                    elif prefix in ('Results.item', 'Errors') and event in ('start_map', 'start_array'):
+                        builder = ijson.ObjectBuilder()
+                        builder_prefix = prefix
+                        builder.event(event, value)
+                        has_errors = has_errors or prefix == 'Errors'
+                    elif prefix == 'Errors':
+                        has_errors = True
+                        errors = value
+                    elif prefix == 'NextOffset' and event in ('string', 'number'):
+                        next_offset = value
+                    
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            raise BuiltWithAPIError(f"Request failed: {str(e)}")
+        except ijson.JSONError as e:
+            raise BuiltWithAPIError(f"Invalid JSON response: {str(e)}")
+        
+        if has_errors:
+            raise BuiltWithAPIError(f"API Error: {errors}")
+        
+        return next_offset
+    
+    def _iter_all_results(
+        self,
+        technology: str,
+        include_meta: bool = False,
+        country: Optional[Union[str, Iterable[str]]] = None,
+        since: Optional[str] = None,
+        include_all: bool = False,
+        max_pages: Optional[int] = None
+    ):
+        """
+        Generator that streams individual site results across all pages.
+        
+        Args:
+            technology: Technology name
+            include_meta: Include company metadata
+            country: ISO 3166-1 alpha-2 code(s)
+            since: Date filter
+            include_all: Include sites that stopped using the technology
+            max_pages: Maximum number of pages to fetch (None = unlimited)
+            
+        Yields:
+            Dict: Each site result
+        """
+        self._validate_tech_args(since, include_all)
+        params = self._build_tech_params(
+            technology=technology,
+            include_meta=include_meta,
+            country=country,
+            since=since,
+            include_all=include_all
+        )
+        page_count = 0
+        
+        while True:
+            if max_pages is not None and page_count >= max_pages:
+                break
+            
+            next_offset = yield from self._iter_results(params)
+            page_count += 1
+            
+            if not next_offset or next_offset == 'END':
+                break
+            
+            params["OFFSET"] = next_offset
+    
+    def get_tech_list(
+        self,
+        technology: str,
+        include_meta: bool = False,
+        country: Optional[Union[str, Iterable[str]]] = None,
+        offset: Optional[str] = None,
+        since: Optional[str] = None,
+        include_all: bool = False,
+        format: Literal["json", "xml", "txt", "csv", "tsv"] = "json",
+        raw: bool = False
+    ) -> Union[Dict, str, bytes]:
+        """
+        Get websites using a specific technology.
+        
+        Args:
+            technology: Technology name (e.g., "Shopify", "Magento")
+            include_meta: Include company metadata (name, emails, phones, social)
+            country: ISO 3166-1 alpha-2 code(s) (e.g., "US" or ["US", "CA"]; any iterable of codes works)
+            offset: Pagination token from NextOffset field
+            since: Date filter (e.g., "2024-01-01" or "30 Days Ago")
+            include_all: Include sites that stopped using the technology
+            format: Response format (json, xml, txt, csv, tsv)
+            raw: Return the undecoded body bytes for non-json formats (e.g. to pass to lxml)
+            
+        Returns:
+            Dict with 'NextOffset' and 'Results' keys for json format, raw text (or bytes if raw) for other formats
+            
+        Raises:
+            ValueError: If both 'since' and 'include_all' are specified, or the format is not supported
+            BuiltWithAPIError: If the API request fails
+        """
+        self._validate_tech_args(since, include_all)
+        params = self._build_tech_params(
+            technology=technology,
+            include_meta=include_meta,
+            country=country,
+            offset=offset,
+            since=since,
+            include_all=include_all
+        )
+        
+        return self._make_request(params, format, raw)
+    
+    def iter_tech_list_rows(
+        self,
+        technology: str,
+        include_meta: bool = False,
+        country: Optional[Union[str, Iterable[str]]] = None,
+        offset: Optional[str] = None,
+        since: Optional[str] = None,
+        include_all: bool = False,
+        format: Literal["csv", "tsv", "txt"] = "csv"
+    ):
+        """
+        Stream a text export line by line as it is received.
+        
+        Unlike get_tech_list, the body is never buffered into a single string.
+        Bodies without a declared charset are decoded as UTF-8.
+        Wrap the generator with csv.reader to parse csv/tsv rows.
+        
+        Args:
+            technology: Technology name
+            include_meta: Include company metadata
+            country: ISO 3166-1 alpha-2 code(s)
+            offset: Pagination token from NextOffset field
+            since: Date filter
+            include_all: Include sites that stopped using the technology
+            format: Response format (csv, tsv, txt)
+            
+        Yields:
+            str: Each line of the response body
+            
+        Raises:
+            ValueError: If both 'since' and 'include_all' are specified, or the format is not supported
+            BuiltWithAPIError: If the API request fails
+        """
+        self._validate_tech_args(since, include_all)
+        params = self._build_tech_params(
+            technology=technology,
+            include_meta=include_meta,
+            country=country,
+            offset=offset,
+            since=since,
+            include_all=include_all
+        )
+        url = self._build_url(format)
+        
+        try:
+            if self.use_httpx:
+                with self.session.stream("GET", url, params=params, timeout=30) as response:
+                    response.raise_for_status()
+                    if not _has_charset(response):
+                        response.encoding = "utf-8"
+                    yield from response.iter_lines()
+            else:
+                with self.session.get(url, params=params, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    # requests would otherwise fall back to ISO-8859-1 for text/*
+                    if not _has_charset(response):
+                        response.encoding = "utf-8"
+                    yield from response.iter_lines(decode_unicode=True)
+                    
+        except (requests.exceptions.RequestException, httpx.HTTPError, urllib3.exceptions.HTTPError) as e:
+            raise BuiltWithAPIError(f"Request failed: {str(e)}")
     
     def iterate_tech_list(
         self,
         technology: str,
         include_meta: bool = False,
-        country: Optional[Union[str, List[str]]] = None,
+        country: Optional[Union[str, Iterable[str]]] = None,
         since: Optional[str] = None,
         include_all: bool = False,
         max_pages: Optional[int] = None
@@ -166,7 +736,14 @@ class BuiltWithListsClient:
         Yields:
             Dict: Each page of results with 'NextOffset' and 'Results' keys
         """
-        offset = None
+        self._validate_tech_args(since, include_all)
+        params = self._build_tech_params(
+            technology=technology,
+            include_meta=include_meta,
+            country=country,
+            since=since,
+            include_all=include_all
+        )
         page_count = 0
         
         while True:
@@ -174,14 +751,7 @@ class BuiltWithListsClient:
             if max_pages is not None and page_count >= max_pages:
                 break
             
-            result = self.get_tech_list(
-                technology=technology,
-                include_meta=include_meta,
-                country=country,
-                offset=offset,
-                since=since,
-                include_all=include_all
-            )
+            result = self._make_request(params, "json")
             
             yield result
             page_count += 1
@@ -190,13 +760,13 @@ class BuiltWithListsClient:
             if not next_offset or next_offset == 'END':
                 break
             
-            offset = next_offset
+            params["OFFSET"] = next_offset
     
     def get_all_tech_list(
         self,
         technology: str,
         include_meta: bool = False,
-        country: Optional[Union[str, List[str]]] = None,
+        country: Optional[Union[str, Iterable[str]]] = None,
         since: Optional[str] = None,
         include_all: bool = False,
         max_pages: Optional[int] = None
@@ -217,7 +787,7 @@ class BuiltWithListsClient:
         """
         all_results = []
         
-        for page in self.iterate_tech_list(
+        for result in self._iter_all_results(
             technology=technology,
             include_meta=include_meta,
             country=country,
@@ -225,10 +795,176 @@ class BuiltWithListsClient:
             include_all=include_all,
             max_pages=max_pages
         ):
-            all_results.extend(page.get('Results', []))
+            all_results.append(result)
         
         return all_results
     
+    async def _aiterate_pages(
+        self,
+        client: httpx.AsyncClient,
+        params: Dict[str, str],
+        max_pages: Optional[int] = None
+    ):
+        """
+        Async generator that paginates a single query with the given client.
+        
+        Args:
+            client: Async client to send the requests with
+            params: Query parameters from _build_tech_params
+            max_pages: Maximum number of pages to fetch (None = unlimited)
+            
+        Yields:
+            Dict: Each page of results with 'NextOffset' and 'Results' keys
+        """
+        page_count = 0
+        
+        while True:
+            if max_pages is not None and page_count >= max_pages:
+                break
+            
+            result = await self._amake_request(client, params, "json")
+            
+            yield result
+            page_count += 1
+            
+            next_offset = result.get('NextOffset')
+            if not next_offset or next_offset == 'END':
+                break
+            
+            params["OFFSET"] = next_offset
+    
+    async def aiterate_tech_list(
+        self,
+        technology: str,
+        include_meta: bool = False,
+        country: Optional[Union[str, Iterable[str]]] = None,
+        since: Optional[str] = None,
+        include_all: bool = False,
+        max_pages: Optional[int] = None
+    ):
+        """
+        Async generator that handles pagination automatically.
+        
+        Pages within a single query are fetched sequentially, since each
+        request needs the NextOffset of the previous page.
+        
+        Args:
+            technology: Technology name
+            include_meta: Include company metadata
+            country: ISO 3166-1 alpha-2 code(s)
+            since: Date filter
+            include_all: Include sites that stopped using the technology
+            max_pages: Maximum number of pages to fetch (None = unlimited)
+            
+        Yields:
+            Dict: Each page of results with 'NextOffset' and 'Results' keys
+        """
+        self._validate_tech_args(since, include_all)
+        params = self._build_tech_params(
+            technology=technology,
+            include_meta=include_meta,
+            country=country,
+            since=since,
+            include_all=include_all
+        )
+        
+        async with self._async_client(max_connections=1) as client:
+            async for page in self._aiterate_pages(client, params, max_pages):
+                yield page
+    
+    async def _aget_all_for_query(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        params: Dict[str, str],
+        max_pages: Optional[int]
+    ) -> List[Dict]:
+        """Collect all pages of a single query once a concurrency slot is free."""
+        all_results = []
+        
+        async with semaphore:
+            async for page in self._aiterate_pages(client, params, max_pages):
+                all_results.extend(page.get('Results', []))
+        
+        return all_results
+    
+    async def aget_all_tech_list(
+        self,
+        technologies: Union[str, Iterable[str]],
+        countries: Optional[Union[str, Iterable[str]]] = None,
+        include_meta: bool = False,
+        since: Optional[str] = None,
+        include_all: bool = False,
+        max_pages: Optional[int] = None,
+        concurrency: int = 20
+    ) -> Dict[Tuple[str, Optional[str]], List[Dict]]:
+        """
+        Get all results for several independent queries concurrently.
+        
+        One query is run per (technology, country) pair; up to `concurrency`
+        queries are fetched at once while each one paginates sequentially.
+        
+        Args:
+            technologies: Technology name(s)
+            countries: ISO 3166-1 alpha-2 code(s), one query per country (None = no country filter)
+            include_meta: Include company metadata
+            since: Date filter
+            include_all: Include sites that stopped using the technology
+            max_pages: Maximum number of pages to fetch per query (None = unlimited)
+            concurrency: Maximum number of queries in flight at once
+            
+        Returns:
+            Dict mapping (technology, country) to the list of site result dicts for that query
+            
+        Raises:
+            ValueError: If both 'since' and 'include_all' are specified
+            BuiltWithAPIError: If any API request fails
+        """
+        self._validate_tech_args(since, include_all)
+        
+        # A single str is one technology/country, not an iterable of characters
+        if isinstance(technologies, str):
+            technologies = [technologies]
+        if isinstance(countries, str):
+            countries = [countries]
+        technologies = list(technologies)
+        countries = list(countries) if countries is not None else []
+        if not countries:
+            countries = [None]
+        queries = [
+            (technology, country)
+            for technology in technologies
+            for country in countries
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with self._async_client(max_connections=concurrency) as client:
+            tasks = [
+                asyncio.ensure_future(self._aget_all_for_query(
+                    client,
+                    semaphore,
+                    self._build_tech_params(
+                        technology=technology,
+                        include_meta=include_meta,
+                        country=country,
+                        since=since,
+                        include_all=include_all
+                    ),
+                    max_pages
+                ))
+                for technology, country in queries
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop the remaining queries before the client is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        
+        return dict(zip(queries, results))
+    
     def parse_result(self, result: Dict) -> Dict:
         """
         Parse API result into readable format with datetime objects.
@@ -239,41 +975,69 @@ class BuiltWithListsClient:
         Returns:
             Dict with readable field names and datetime objects instead of epoch timestamps
         """
-        parsed = {
-            'domain': result.get('D'),
-            'locations_on_site': result.get('LOS', []),
-            'first_detected': self._parse_epoch(result.get('FD')),
-            'last_detected': self._parse_epoch(result.get('LD')),
-            'monthly_spend_usd': result.get('S'),
-            'unique_products': result.get('SKU'),
-            'estimated_revenue': result.get('R'),
-            'social_followers': result.get('F'),
-            'employee_count': result.get('E'),
-            'page_rank': result.get('A'),
-            'tranco_rank': result.get('Q'),
-            'majestic_rank': result.get('M'),
-            'umbrella_rank': result.get('U'),
-        }
+        return self.parse_results([result])[0]
+    
+    def parse_results(self, results: List[Dict]) -> List[Dict]:
+        """
+        Parse a list of API results into readable format with datetime objects.
+        
+        Args:
+            results: Result dicts from API responses (e.g. the output of get_all_tech_list)
+            
+        Returns:
+            List of dicts with readable field names and datetime objects instead of epoch timestamps
+        """
+        fromtimestamp = datetime.fromtimestamp
+        parsed_results = []
         
-        if 'META' in result:
-            parsed['metadata'] = result['META']
+        for result in results:
+            parsed = {}
+            for key, field, kind in _FIELD_MAP:
+                if kind == 'epoch':
+                    epoch_seconds = result.get(field)
+                    parsed[key] = fromtimestamp(epoch_seconds) if epoch_seconds is not None else None
+                elif kind == 'list':
+                    parsed[key] = result.get(field, [])
+                else:
+                    parsed[key] = result.get(field)
+            
+            if 'META' in result:
+                parsed['metadata'] = result['META']
+            
+            parsed_results.append(parsed)
         
-        return parsed
+        return parsed_results
     
-    @staticmethod
-    def _parse_epoch(epoch_seconds: Optional[int]) -> Optional[datetime]:
+    def to_dataframe(self, results: List[Dict]):
         """
-        Convert epoch seconds to datetime object.
+        Convert a list of API results into a pandas DataFrame.
+        
+        Columns get the same readable names as parse_result, and the epoch
+        columns are converted in one vectorized pass (naive UTC timestamps).
         
         Args:
-            epoch_seconds: Unix timestamp in seconds
+            results: Result dicts from API responses (e.g. the output of get_all_tech_list)
             
         Returns:
-            datetime object or None if input is None
+            pandas DataFrame with one row per result
+            
+        Raises:
+            ImportError: If pandas is not installed
         """
-        if epoch_seconds:
-            return datetime.fromtimestamp(epoch_seconds)
-        return None
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("to_dataframe requires pandas: pip install pandas")
+        
+        columns = {field: key for key, field, _ in _FIELD_MAP}
+        columns['META'] = 'metadata'
+        
+        df = pd.DataFrame.from_records(results).rename(columns=columns)
+        for key in _EPOCH_FIELDS:
+            if key in df:
+                df[key] = pd.to_datetime(df[key], unit='s', errors='coerce')
+        
+        return df
 
 
 class BuiltWithKeywordsClient:
@@ -281,15 +1045,33 @@ class BuiltWithKeywordsClient:
     
     BASE_URL = "https://api.builtwith.com/kw2/api"
     
-    def __init__(self, api_key: str = builtWithAPIKey):
+    def __init__(
+        self,
+        api_key: str = builtWithAPIKey,
+        cache: bool = False,
+        cache_ttl: int = 86400,
+        use_httpx: bool = False,
+        conditional_requests: bool = False
+    ):
         """
         Initialize the BuiltWith Keywords API client.
         
         Args:
             api_key: Your BuiltWith API key
+            cache: Cache successful responses on disk so repeated queries don't spend API credits
+            cache_ttl: Seconds before a cached response expires (default 1 day)
+            use_httpx: Send requests through an HTTP/2 httpx Client instead of requests
+            conditional_requests: Remember ETag/Last-Modified of responses in memory and
+                revalidate repeat requests, reusing the stored body on 304 Not Modified
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.cache = cache
+        self.use_httpx = use_httpx
+        self.session = _create_session(cache=cache, cache_ttl=cache_ttl, use_httpx=use_httpx)
+        self._conditional_cache: Optional[Dict[str, Tuple[Dict[str, str], Union[str, bytes]]]] = (
+            {} if conditional_requests else None
+        )
+        self._urls = {fmt: f"{self.BASE_URL}.{fmt}" for fmt in ("json", "xml")}
         if self.api_key is None:
             raise ValueError("BUILTWITH_API_KEY is not set")
     
@@ -302,61 +1084,96 @@ class BuiltWithKeywordsClient:
             
         Returns:
             Full API endpoint URL
+            
+        Raises:
+            ValueError: If the format is not supported
         """
-        return f"{self.BASE_URL}.{format}"
+        try:
+            return self._urls[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format {format!r}, expected one of: {', '.join(self._urls)}") from None
     
     def _make_request(
         self,
         params: Dict[str, str],
-        format: str = "json"
-    ) -> Union[Dict, str]:
+        format: str = "json",
+        raw: bool = False
+    ) -> Union[Dict, str, bytes]:
         """
         Make a request to the BuiltWith Keywords API.
         
         Args:
             params: Query parameters for the API request
             format: Response format (json, xml)
+            raw: Return the undecoded body bytes for xml format
             
         Returns:
-            Parsed JSON dict for json format, raw text for xml format
+            Parsed JSON dict for json format, raw text (or bytes if raw) for xml format
             
         Raises:
             BuiltWithAPIError: If the API returns an error or request fails
         """
         url = self._build_url(format)
+        headers = dict(_JSON_HEADERS) if format == "json" else {}
+        
+        # Revalidate a previously seen response instead of downloading it again
+        cache_key = None
+        cached = None
+        if self._conditional_cache is not None:
+            cache_key = _conditional_cache_key(format, raw, params)
+            cached = self._conditional_cache.get(cache_key)
+            if cached is not None:
+                headers.update(cached[0])
         
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
+            if cached is not None and response.status_code == 304:
+                # JSON is stored as body bytes so each hit returns a fresh object
+                return _loads(cached[1]) if format == "json" else cached[1]
             response.raise_for_status()
             
             if format == "json":
-                data = response.json()
-                if isinstance(data, dict) and 'Errors' in data:
-                    raise BuiltWithAPIError(f"API Error: {data['Errors']}")
-                return data
-            return response.text
+                result = _loads(response.content)
+                if isinstance(result, dict) and 'Errors' in result:
+                    raise BuiltWithAPIError(f"API Error: {result['Errors']}")
+            elif raw:
+                result = response.content
+            else:
+                result = response.text
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, httpx.HTTPError) as e:
             raise BuiltWithAPIError(f"Request failed: {str(e)}")
+        except ValueError as e:
+            raise BuiltWithAPIError(f"Invalid JSON response: {str(e)}")
+        
+        if cache_key is not None:
+            validators = _conditional_headers(response)
+            if validators:
+                body = response.content if format == "json" else result
+                self._conditional_cache[cache_key] = (validators, body)
+        
+        return result
     
     def get_keywords(
         self,
         domain: Union[str, List[str]],
-        format: Literal["json", "xml"] = "json"
-    ) -> Union[Dict, str]:
+        format: Literal["json", "xml"] = "json",
+        raw: bool = False
+    ) -> Union[Dict, str, bytes]:
         """
         Get keywords for one or more domains.
         
         Args:
             domain: Single domain string or list of up to 16 domains (root domains only, no subdomains)
             format: Response format (json, xml)
+            raw: Return the undecoded body bytes for xml format (e.g. to pass to lxml)
             
         Returns:
-            Dict with domain and keywords for json format, raw text for xml format
+            Dict with domain and keywords for json format, raw text (or bytes if raw) for xml format
             
         Raises:
             BuiltWithAPIError: If the API request fails
-            ValueError: If more than 16 domains are provided
+            ValueError: If more than 16 domains are provided, or the format is not supported
         """
         if isinstance(domain, list):
             if len(domain) > 16:
@@ -365,24 +1182,51 @@ class BuiltWithKeywordsClient:
         else:
             lookup = domain
         
+        return self._get_keywords_raw(lookup, format, raw)
+    
+    def _get_keywords_raw(
+        self,
+        lookup: str,
+        format: Literal["json", "xml"] = "json",
+        raw: bool = False
+    ) -> Union[Dict, str, bytes]:
+        """
+        Get keywords for an already comma-joined LOOKUP string.
+        
+        Args:
+            lookup: Comma-separated domains (at most 16)
+            format: Response format (json, xml)
+            raw: Return the undecoded body bytes for xml format (e.g. to pass to lxml)
+            
+        Returns:
+            Dict with domain and keywords for json format, raw text (or bytes if raw) for xml format
+            
+        Raises:
+            BuiltWithAPIError: If the API request fails
+        """
         params = {
             "KEY": self.api_key,
             "LOOKUP": lookup
         }
         
-        return self._make_request(params, format)
+        return self._make_request(params, format, raw)
     
     def get_keywords_batch(
         self,
         domains: List[str],
-        batch_size: int = 16
+        batch_size: int = 16,
+        max_workers: int = 8
     ) -> List[Dict]:
         """
         Get keywords for a large list of domains by batching requests.
         
+        Batches are requested concurrently over the shared session; results
+        are returned in the same order as the batches.
+        
         Args:
             domains: List of domain strings
             batch_size: Number of domains per request (max 16)
+            max_workers: Maximum number of concurrent requests
             
         Returns:
             List of result dicts from all batches combined
@@ -393,16 +1237,15 @@ class BuiltWithKeywordsClient:
         if batch_size > 16:
             raise ValueError("Maximum batch size is 16 domains")
         
-        all_results = []
+        lookups = [",".join(domains[i:i + batch_size]) for i in range(0, len(domains), batch_size)]
+        if not lookups:
+            return []
         
-        for i in range(0, len(domains), batch_size):
-            batch = domains[i:i + batch_size]
-            result = self.get_keywords(batch)
-            
-            if isinstance(result, dict):
-                all_results.append(result)
-        
-        return all_results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(lookups))) as executor:
+            return [
+                result for result in executor.map(self._get_keywords_raw, lookups)
+                if isinstance(result, dict)
+            ]
 
 if __name__ == "__main__":
     # Test Lists API